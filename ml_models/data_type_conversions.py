@@ -1,8 +1,9 @@
+import concurrent.futures
+import threading
+from typing import Dict, Tuple
 import tensorflow as tf
 import tensorflow_hub as hub
-import tensorflow_probability as tfp
 import numpy as np
-from scipy.io import wavfile
 from german_transliterate.core import GermanTransliterate
 import yaml
 from tensorflow_tts.models import TFMelGANGenerator
@@ -20,16 +21,114 @@ ALL_SYMBOLS = (
     [_pad] + list(_special) + list(_punctuation) + list(_letters) + [_eos]
 )
 
+# Sequence length produced by the BERT preprocessor feeding the text-to-text encoder
+_TEXT_SEQ_LENGTH = 128
+
+# Keras dtype policy of the MB-MelGAN generator
+_VOCODER_POLICY = "mixed_bfloat16"
+
+_SYMBOL_TO_ID = {s: i for i, s in enumerate(ALL_SYMBOLS)}
+_PAD_ID = _SYMBOL_TO_ID[_pad]
+# Lookup table from Latin-1 code point to symbol id; the extra last slot
+# catches every character outside Latin-1 and maps it to the pad id
+_LUT = np.full(257, _PAD_ID, dtype=np.int32)
+for _symbol, _id in _SYMBOL_TO_ID.items():
+    if len(_symbol) == 1:
+        _LUT[ord(_symbol)] = _id
+_LUT.flags.writeable = False
+
+def text_to_sequence(text):
+    """Map each character of text to its symbol id, returning an int32 array."""
+    # surrogatepass keeps lone surrogates as code points so they map to pad like any unknown character
+    code_points = np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype='<u4')
+    return _LUT[np.minimum(code_points, 256)]
+
 class Processor:
-    def __init__(self):
-        self.symbol_to_id = {s: i for i, s in enumerate(ALL_SYMBOLS)}
+    symbol_to_id = _SYMBOL_TO_ID
 
     def text_to_sequence(self, text):
-        return [self.symbol_to_id.get(s, self.symbol_to_id[_pad]) for s in text]
+        return text_to_sequence(text).tolist()
+
+def embedding_statistics(embeddings):
+    """
+    Compute summary statistics over all values of an embedding tensor.
+
+    The values are pooled across every axis, so each statistic is a scalar rather than a
+    per-dimension tensor. Variance is the population variance and kurtosis is excess kurtosis.
+    A constant input has zero variance; its skewness and kurtosis are reported as 0 instead of NaN.
+
+    :param embeddings: Embedding tensor of any shape.
+    :return: Tuple of (mean, variance, stddev, skewness, kurtosis) scalars.
+    """
+    # tf.nn.moments yields mean and variance from a single pass over the tensor
+    mean, variance = tf.nn.moments(embeddings, axes=list(range(embeddings.shape.rank)))
+    stddev = tf.sqrt(variance)
+    standardized = tf.math.divide_no_nan(embeddings - mean, stddev)
+    skewness = tf.reduce_mean(standardized ** 3)
+    kurtosis = tf.where(variance > 0, tf.reduce_mean(standardized ** 4) - 3.0, 0.0)
+    return mean, variance, stddev, skewness, kurtosis
+
+# Objects shared by every DataTypeConversions instance in the process: models keyed by their
+# hub URL or name, plus the vocoder config, the ImageNet labels and the error placeholders
+_MODEL_CACHE = {}
+_MODEL_LOCKS = {}
+_MODEL_LOCK = threading.Lock()
+
+def _load_shared(key, loader):
+    """
+    Return the process-wide object stored under key, calling loader to create it on first use.
+
+    Each key has its own lock, so different models can load concurrently while concurrent
+    requests for the same model wait on a single load.
+    """
+    model = _MODEL_CACHE.get(key)
+    if model is None:
+        with _MODEL_LOCK:
+            key_lock = _MODEL_LOCKS.setdefault(key, threading.Lock())
+        with key_lock:
+            model = _MODEL_CACHE.get(key)
+            if model is None:
+                model = _MODEL_CACHE[key] = loader()
+    return model
+
+def _hub_load(url):
+    return _load_shared(url, lambda: hub.load(url))
+
+# Held while the global Keras dtype policy is temporarily changed and while any Keras layer is
+# constructed, so no layer picks up a policy that was meant for another model on another thread
+_KERAS_POLICY_LOCK = threading.Lock()
+
+def _build_keras_hub_layer(url):
+    # Download outside the lock so concurrent loads still overlap their network I/O
+    path = hub.resolve(url)
+    with _KERAS_POLICY_LOCK:
+        return hub.KerasLayer(path)
+
+def _hub_keras_layer(url):
+    return _load_shared(url, lambda: _build_keras_hub_layer(url))
+
+def _to_image_tensor(image):
+    """
+    Convert any tensor-like image to a batched float32 tensor.
+
+    A single (height, width, channels) image gets a leading batch axis; batched float32
+    tensors are returned unchanged.
+    """
+    image = tf.convert_to_tensor(image)
+    if image.dtype != tf.float32:
+        image = tf.image.convert_image_dtype(image, tf.float32)
+    if image.shape.rank == 3:
+        image = tf.expand_dims(image, axis=0)
+    return image
+
+def _placeholder(shape):
+    """Return the shared all-zero tensor of the given shape that conversions return on error."""
+    return _load_shared(('placeholder', shape), lambda: tf.zeros(shape))
 
 class DataTypeConversions:
     def __init__(self):
         # Initialize pre-trained models as None for lazy loading
+        self.text_preprocessor = None
         self.text_to_text_model = None
         self.text_to_image_model = None
         self.text_to_video_model = None
@@ -38,13 +137,58 @@ class DataTypeConversions:
         self.image_to_image_model = None
         self.image_to_video_model = None
         self.image_captioning_model = None
+        self.imagenet_labels = None
         self.mb_melgan_model = None
         self.pqmf_model = None
+        self.mb_config = None
+        self.audio_synthesizer = None
+        # Text normalizer shared by the text-to-audio paths
+        self.transliterator = GermanTransliterate(replace={';': ',', ':': ' '}, sep_abbreviation=' -- ')
+        # Cache of graph functions wrapping each loaded model, keyed by conversion name
+        self._compiled = {}
+
+    def _compile(self, name, fn, input_signature, jit_compile=True):
+        """
+        Stage a model invocation as a cached graph function so its ops can be fused.
+
+        :param name: Key under which the graph function is cached.
+        :param fn: Python callable invoking the model.
+        :param input_signature: List of tf.TensorSpec describing the inputs.
+        :param jit_compile: Whether to compile the graph with XLA.
+        :return: The cached graph function.
+        """
+        if name not in self._compiled:
+            self._compiled[name] = tf.function(fn, input_signature=input_signature, jit_compile=jit_compile)
+        return self._compiled[name]
+
+    def _warm_up(self, name, *inputs):
+        """
+        Run a cached graph function once on dummy inputs so tracing and XLA compilation happen at load time.
+
+        :param name: Key of the graph function in the cache.
+        :param inputs: Dummy inputs with representative shapes.
+        """
+        try:
+            self._compiled[name](*inputs)
+        except Exception as e:
+            print(f"Error warming up {name} graph: {e}")
 
     def load_text_to_text_model(self):
         if self.text_to_text_model is None:
             try:
-                self.text_to_text_model = hub.KerasLayer("https://www.kaggle.com/models/google/universal-sentence-encoder/TensorFlow2/cmlm-en-base/1")
+                # Tokenize on the host so the encoder graph only sees fixed-length integer ids
+                self.text_preprocessor = _hub_keras_layer("https://tfhub.dev/tensorflow/bert_en_uncased_preprocess/3")
+                model = _hub_keras_layer("https://www.kaggle.com/models/google/universal-sentence-encoder/TensorFlow2/cmlm-en-base/1")
+                encoder_inputs = {
+                    key: tf.TensorSpec([None, _TEXT_SEQ_LENGTH], tf.int32)
+                    for key in ('input_word_ids', 'input_mask', 'input_type_ids')
+                }
+                self._compile('t2t', lambda x: model(x, training=False)['default'], [encoder_inputs])
+                self._compile('t2t_stats', embedding_statistics, [tf.TensorSpec([None, None], tf.float32)])
+                self._warm_up('t2t', self.text_preprocessor(tf.constant([""])))
+                self._warm_up('t2t_stats', tf.zeros([1, 768]))
+                # Publish the model last so other threads never see it before its graphs exist
+                self.text_to_text_model = model
             except Exception as e:
                 print(f"Error loading text-to-text model: {e}")
         return self.text_to_text_model
@@ -52,7 +196,7 @@ class DataTypeConversions:
     def load_text_to_image_model(self):
         if self.text_to_image_model is None:
             try:
-                self.text_to_image_model = hub.load("https://kaggle.com/models/deepmind/biggan/frameworks/TensorFlow1/variations/128/versions/1")
+                self.text_to_image_model = _hub_load("https://kaggle.com/models/deepmind/biggan/frameworks/TensorFlow1/variations/128/versions/1")
             except Exception as e:
                 print(f"Error loading text-to-image model: {e}")
         return self.text_to_image_model
@@ -60,7 +204,7 @@ class DataTypeConversions:
     def load_text_to_video_model(self):
         if self.text_to_video_model is None:
             try:
-                self.text_to_video_model = hub.load("https://tfhub.dev/deepmind/video-transformer/1")
+                self.text_to_video_model = _hub_load("https://tfhub.dev/deepmind/video-transformer/1")
             except Exception as e:
                 print(f"Error loading text-to-video model: {e}")
         return self.text_to_video_model
@@ -68,15 +212,39 @@ class DataTypeConversions:
     def load_text_to_audio_model(self):
         if self.text_to_audio_model is None:
             try:
-                self.text_to_audio_model = hub.load("https://tfhub.dev/monatis/german-tacotron2/1")
+                self.text_to_audio_model = _hub_load("https://tfhub.dev/monatis/german-tacotron2/1")
             except Exception as e:
                 print(f"Error loading text-to-audio model: {e}")
         return self.text_to_audio_model
 
+    def load_mb_config(self):
+        if self.mb_config is None:
+            self.mb_config = _load_shared('mb_config', MultiBandMelGANGeneratorConfig)
+        return self.mb_config
+
+    def _build_mb_melgan(self):
+        config = self.load_mb_config()
+        # Build the generator under a bfloat16 compute policy without leaking it to other models
+        with _KERAS_POLICY_LOCK:
+            previous_policy = tf.keras.mixed_precision.global_policy()
+            try:
+                tf.keras.mixed_precision.set_global_policy(_VOCODER_POLICY)
+                mb_melgan = TFMelGANGenerator(config)
+                # Create the generator weights once here instead of on the first synthesis call
+                mb_melgan._build()
+                return mb_melgan
+            finally:
+                tf.keras.mixed_precision.set_global_policy(previous_policy)
+
+    def _build_pqmf(self):
+        config = self.load_mb_config()
+        with _KERAS_POLICY_LOCK:
+            return TFPQMF(config=config, name="pqmf")
+
     def load_mb_melgan_model(self):
         if self.mb_melgan_model is None:
             try:
-                self.mb_melgan_model = TFMelGANGenerator(MultiBandMelGANGeneratorConfig())
+                self.mb_melgan_model = _load_shared('mb_melgan', self._build_mb_melgan)
             except Exception as e:
                 print(f"Error loading mb_melgan model: {e}")
         return self.mb_melgan_model
@@ -84,16 +252,41 @@ class DataTypeConversions:
     def load_pqmf_model(self):
         if self.pqmf_model is None:
             try:
-                config = MultiBandMelGANGeneratorConfig()
-                self.pqmf_model = TFPQMF(config=config, name="pqmf")
+                self.pqmf_model = _load_shared('pqmf', self._build_pqmf)
             except Exception as e:
                 print(f"Error loading pqmf model: {e}")
         return self.pqmf_model
 
+    def load_mb_melgan(self):
+        """
+        Load the MB-MelGAN generator and its PQMF synthesis filter bank together.
+
+        :return: Tuple of (mb_melgan, pqmf), each built only once per process.
+        """
+        return self.load_mb_melgan_model(), self.load_pqmf_model()
+
+    def load_audio_synthesizer(self):
+        if self.audio_synthesizer is None:
+            tacotron2 = self.load_text_to_audio_model()
+            mb_melgan, pqmf = self.load_mb_melgan()
+            if tacotron2 is not None and mb_melgan is not None and pqmf is not None:
+                # Stage the full synthesis pipeline as one graph function. Tacotron2 decodes with a
+                # data-dependent loop, so the graph is not XLA-compiled; its (None,) spec means a
+                # single trace serves every input length, so warming up once covers all requests.
+                self._compile('t2a', self._synthesize_audio, [tf.TensorSpec([None], tf.int32)], jit_compile=False)
+                self._warm_up('t2a', tf.constant(text_to_sequence("hallo"), dtype=tf.int32))
+                self.audio_synthesizer = self._compiled['t2a']
+        return self.audio_synthesizer
+
     def load_image_to_text_model(self):
         if self.image_to_text_model is None:
             try:
-                self.image_to_text_model = hub.load("https://tfhub.dev/google/imagenet/inception_v3/classification/4")
+                model = _hub_load("https://tfhub.dev/google/imagenet/inception_v3/classification/4")
+                # Take the top class in the graph so only its index leaves the device
+                self._compile('i2t', lambda x: tf.argmax(model(x), axis=-1),
+                              [tf.TensorSpec([None, None, None, 3], tf.float32)])
+                self._warm_up('i2t', tf.zeros([1, 299, 299, 3]))
+                self.image_to_text_model = model
             except Exception as e:
                 print(f"Error loading image-to-text model: {e}")
         return self.image_to_text_model
@@ -101,7 +294,11 @@ class DataTypeConversions:
     def load_image_to_image_model(self):
         if self.image_to_image_model is None:
             try:
-                self.image_to_image_model = hub.load("https://tfhub.dev/google/magenta/arbitrary-image-stylization-v1-256/2")
+                model = _hub_load("https://tfhub.dev/google/magenta/arbitrary-image-stylization-v1-256/2")
+                self._compile('i2i', lambda x: model([x, x]),
+                              [tf.TensorSpec([None, None, None, 3], tf.float32)])
+                self._warm_up('i2i', tf.zeros([1, 256, 256, 3]))
+                self.image_to_image_model = model
             except Exception as e:
                 print(f"Error loading image-to-image model: {e}")
         return self.image_to_image_model
@@ -109,7 +306,7 @@ class DataTypeConversions:
     def load_image_to_video_model(self):
         if self.image_to_video_model is None:
             try:
-                self.image_to_video_model = hub.load("https://tfhub.dev/deepmind/video-transformer/1")
+                self.image_to_video_model = _hub_load("https://tfhub.dev/deepmind/video-transformer/1")
             except Exception as e:
                 print(f"Error loading image-to-video model: {e}")
         return self.image_to_video_model
@@ -117,54 +314,84 @@ class DataTypeConversions:
     def load_image_captioning_model(self):
         if self.image_captioning_model is None:
             try:
-                self.image_captioning_model = hub.load("https://tfhub.dev/google/imagenet/inception_v3/classification/4")
+                model = _hub_load("https://tfhub.dev/google/imagenet/inception_v3/classification/4")
+                # Take the top class in the graph so only its index leaves the device
+                self._compile('img_caption', lambda x: tf.argmax(model(x), axis=-1),
+                              [tf.TensorSpec([None, None, None, 3], tf.float32)])
+                self._warm_up('img_caption', tf.zeros([1, 299, 299, 3]))
+                self.image_captioning_model = model
             except Exception as e:
                 print(f"Error loading image captioning model: {e}")
         return self.image_captioning_model
 
-    def text_to_text(self, text: str, detailed: bool = True) -> str:
+    def load_imagenet_labels(self):
+        if self.imagenet_labels is None:
+            try:
+                self.imagenet_labels = _load_shared('imagenet_labels', self._read_imagenet_labels)
+            except Exception as e:
+                print(f"Error loading ImageNet labels: {e}")
+        return self.imagenet_labels
+
+    def _read_imagenet_labels(self):
+        labels_path = tf.keras.utils.get_file(
+            'ImageNetLabels.txt',
+            'https://storage.googleapis.com/download.tensorflow.org/data/ImageNetLabels.txt'
+        )
+        with open(labels_path) as f:
+            return f.read().splitlines()
+
+    def preload_all(self, max_workers: int = 4):
+        """
+        Load every model up front, downloading the hub models concurrently.
+
+        :param max_workers: Number of threads used for the downloads.
+        """
+        loaders = [
+            self.load_text_to_text_model,
+            self.load_text_to_image_model,
+            self.load_text_to_video_model,
+            self.load_image_to_text_model,
+            self.load_image_to_image_model,
+            self.load_image_to_video_model,
+            self.load_image_captioning_model,
+            self.load_imagenet_labels,
+            self.load_audio_synthesizer,
+        ]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(lambda load: load(), loaders))
+
+    def text_to_text(self, text: str, detailed: bool = True) -> Dict[str, tf.Tensor]:
         """
         Convert text to text using a pre-trained language model.
 
         :param text: Input text.
         :param detailed: Whether to include statistical analysis in the output.
-        :return: A string containing the embeddings as numpy arrays, and optionally the mean, variance, and other statistics of the embeddings.
+        :return: A dict holding the 'embeddings' tensor and, if detailed, the scalar 'mean', 'variance', 'stddev',
+                 'skewness' and 'kurtosis' over all embedding values (see embedding_statistics);
+                 an empty dict on error.
         """
-        if not isinstance(text, str):
-            raise ValueError("Input text must be a string.")
+        text = str(text)
 
-        model = self.load_text_to_text_model()
+        self.load_text_to_text_model()
         try:
             # Prepare input as a tensor
-            inputs = tf.constant([text])
-            embeddings = model(inputs)
-            try:
-                # Convert embeddings to numpy array once for performance optimization
-                embeddings_np = embeddings.numpy()
-            except Exception as e:
-                print(f"Error converting embeddings to numpy array: {e}")
-                return f"Error converting embeddings to numpy array: {e}"
-
-            if detailed:
-                try:
-                    # Perform statistical analysis on embeddings using TensorFlow Probability
-                    mean, variance = tfp.stats.mean(embeddings), tfp.stats.variance(embeddings)
-                    stddev = tfp.stats.stddev(embeddings)
-                    skewness = tfp.stats.skewness(embeddings)
-                    kurtosis = tfp.stats.kurtosis(embeddings)
-                    # Convert statistics to numpy arrays once for performance optimization
-                    mean_np, variance_np = mean.numpy(), variance.numpy()
-                    stddev_np, skewness_np, kurtosis_np = stddev.numpy(), skewness.numpy(), kurtosis.numpy()
-                    return f"Embeddings: {embeddings_np}, Mean: {mean_np}, Variance: {variance_np}, StdDev: {stddev_np}, Skewness: {skewness_np}, Kurtosis: {kurtosis_np}"
-                except Exception as tfp_error:
-                    # Fallback to embeddings-only output if statistical analysis fails
-                    print(f"Error during statistical analysis with TensorFlow Probability: {tfp_error}")
-                    return f"Embeddings: {embeddings_np}, Error during statistical analysis: {tfp_error}"
-            return f"Embeddings: {embeddings_np}"
+            inputs = self.text_preprocessor(tf.constant([text]))
+            embeddings = self._compiled['t2t'](inputs)
         except Exception as e:
             # Handle errors during text-to-text conversion
             print(f"Error during text-to-text conversion: {e}")
-            return f"Error during text-to-text conversion: {e}"
+            return {}
+
+        result = {'embeddings': embeddings}
+        if detailed:
+            try:
+                # Perform statistical analysis on embeddings in a single XLA-compiled graph
+                mean, variance, stddev, skewness, kurtosis = self._compiled['t2t_stats'](embeddings)
+                result.update(mean=mean, variance=variance, stddev=stddev, skewness=skewness, kurtosis=kurtosis)
+            except Exception as e:
+                # Fallback to embeddings-only output if statistical analysis fails
+                print(f"Error during statistical analysis: {e}")
+        return result
 
     def text_to_image(self, text: str) -> tf.Tensor:
         """
@@ -173,8 +400,7 @@ class DataTypeConversions:
         :param text: Input text.
         :return: Generated image tensor.
         """
-        if not isinstance(text, str):
-            raise ValueError("Input text must be a string.")
+        text = str(text)
 
         model = self.load_text_to_image_model()
         noise = tf.random.normal([1, 128])
@@ -185,7 +411,7 @@ class DataTypeConversions:
             return image['output_0']
         except Exception as e:
             print(f"Error during text-to-image conversion: {e}")
-            return tf.zeros([1, 256, 256, 3])  # Return a placeholder tensor on error
+            return _placeholder((1, 256, 256, 3))  # Return a cached placeholder tensor on error
 
     def text_to_class_vector(self, text: str) -> tf.Tensor:
         """
@@ -213,24 +439,22 @@ class DataTypeConversions:
         :param text: Input text.
         :return: Generated video tensor.
         """
-        if not isinstance(text, str):
-            raise ValueError("Input text must be a string.")
+        text = str(text)
 
         model = self.load_text_to_video_model()
         if model is None:
             raise RuntimeError("Failed to load text-to-video model.")
 
-        def generate_frame(text, i):
-            return model(tf.constant([f"{text} frame {i}"]))
-
         try:
-            # Generate 30 frames for the video with varying content based on input text
-            frames = [generate_frame(text, i) for i in range(30)]
-            video = tf.stack(frames, axis=1)
+            # Generate 30 frames for the video with varying content based on input text,
+            # batching the per-frame prompts into a single model call
+            prompts = tf.constant([f"{text} frame {i}" for i in range(30)])
+            frames = model(prompts)
+            video = tf.expand_dims(frames, axis=0)
             return video
         except Exception as e:
             print(f"Error during text-to-video conversion: {e}")
-            return tf.zeros([1, 30, 256, 256, 3])  # Return a placeholder tensor on error
+            return _placeholder((1, 30, 256, 256, 3))  # Return a cached placeholder tensor on error
 
     def text_to_audio(self, text: str) -> tf.Tensor:
         """
@@ -239,167 +463,158 @@ class DataTypeConversions:
         :param text: Input text.
         :return: Generated audio tensor.
         """
-        if not isinstance(text, str):
-            raise ValueError("Input text must be a string.")
+        text = str(text)
 
         # Preprocess input text
-        text = GermanTransliterate(replace={';': ',', ':': ' '}, sep_abbreviation=' -- ').transliterate(text)
-        processor = Processor()
-        input_ids = processor.text_to_sequence(text)
-
-        # Ensure input tensor has the correct shape and type
-        input_tensor = tf.constant([input_ids], dtype=tf.int32)
-
-        # Load models
-        tacotron2 = self.load_text_to_audio_model()
-        mb_melgan = self.load_mb_melgan_model()
-        pqmf = self.load_pqmf_model()
-
-        @tf.function
-        def synthesize_audio(input_tensor):
-            # Generate mel spectrograms
-            _, mel_outputs, _, _ = tacotron2.inference(
-                input_tensor,
-                tf.convert_to_tensor([len(input_ids)], dtype=tf.int32),
-                tf.convert_to_tensor([0], dtype=tf.int32)
-            )
-            # Synthesize audio
-            generated_subbands = mb_melgan(mel_outputs)
-            # Ensure generated_subbands has the correct shape
-            batch_size = tf.shape(generated_subbands)[0]
-            time_steps = tf.shape(generated_subbands)[1]
-            subbands = pqmf.subbands
-            if tf.shape(generated_subbands)[2] != subbands:
-                generated_subbands = tf.reshape(generated_subbands, [batch_size, time_steps // subbands, subbands])
-            audio = pqmf.synthesis(generated_subbands)[0, :-1024, 0]
-            # Ensure the audio tensor has the correct shape
-            audio = tf.pad(audio, [[0, tf.maximum(0, 16000 - tf.shape(audio)[0])]])  # Pad if necessary
-            audio = audio[:16000]  # Trim if necessary
-            return tf.expand_dims(audio, axis=0)  # Ensure shape is (1, 16000)
+        text = self.transliterator.transliterate(text)
+        input_ids = text_to_sequence(text)
+
+        # Symbol ids are passed unbatched; batching and lengths are derived in the graph
+        input_tensor = tf.constant(input_ids, dtype=tf.int32)
+
+        synthesize_audio = self.load_audio_synthesizer()
+        if synthesize_audio is None:
+            raise RuntimeError("Failed to load text-to-audio models.")
 
         try:
             return synthesize_audio(input_tensor)
         except Exception as e:
             raise RuntimeError(f"Error during text-to-audio conversion: {e}")
 
+    def _synthesize_audio(self, input_ids: tf.Tensor) -> tf.Tensor:
+        """
+        Synthesize a fixed-length waveform from symbol ids with Tacotron2, MB-MelGAN and PQMF.
+
+        :param input_ids: Symbol ids of shape (length,).
+        :return: Audio tensor of shape (1, 16000).
+        """
+        # Generate mel spectrograms
+        _, mel_outputs, _, _ = self.text_to_audio_model.inference(
+            tf.expand_dims(input_ids, axis=0),
+            tf.shape(input_ids, out_type=tf.int32)[:1],
+            tf.convert_to_tensor([0], dtype=tf.int32)
+        )
+        # Synthesize audio; the generator computes in bfloat16 and PQMF synthesis runs in float32
+        generated_subbands = tf.cast(self.mb_melgan_model(mel_outputs), tf.float32)
+        # Ensure generated_subbands has the correct shape
+        batch_size = tf.shape(generated_subbands)[0]
+        time_steps = tf.shape(generated_subbands)[1]
+        subbands = self.pqmf_model.subbands
+        if tf.shape(generated_subbands)[2] != subbands:
+            generated_subbands = tf.reshape(generated_subbands, [batch_size, time_steps // subbands, subbands])
+        audio = self.pqmf_model.synthesis(generated_subbands)[0, :-1024, 0]
+        # Ensure the audio tensor has shape (1, 16000) by either padding or trimming, never both
+        audio_length = tf.shape(audio)[0]
+        audio = tf.cond(audio_length < 16000,
+                        lambda: tf.pad(audio, [[0, 16000 - audio_length]]),
+                        lambda: audio[:16000])
+        return tf.ensure_shape(audio[tf.newaxis, :], [1, 16000])
+
+    def read_audio(self, path: str) -> Tuple[tf.Tensor, int]:
+        """
+        Read a WAV file into a tensor using TensorFlow's native decoder.
+
+        :param path: Path of the WAV file.
+        :return: Tuple of the audio tensor of shape (channels, samples) with values in [-1, 1],
+                 and the sample rate in Hz.
+        """
+        audio, sample_rate = tf.audio.decode_wav(tf.io.read_file(path))
+        # decode_wav returns (samples, channels)
+        return tf.transpose(audio), int(sample_rate)
+
+    def write_audio(self, audio: tf.Tensor, path: str, sample_rate: int = 22050):
+        """
+        Write an audio tensor as returned by text_to_audio to a WAV file.
+
+        The file is written as 16-bit PCM, so samples are clipped to [-1, 1] and quantized.
+
+        :param audio: Audio tensor of shape (channels, samples).
+        :param path: Destination path of the WAV file.
+        :param sample_rate: Sample rate of the audio in Hz.
+        """
+        # encode_wav expects (samples, channels)
+        tf.io.write_file(path, tf.audio.encode_wav(tf.transpose(audio), sample_rate))
+
     def image_to_text(self, image: tf.Tensor) -> str:
         """
         Convert image to text using a pre-trained model.
 
-        :param image: Input image tensor.
+        :param image: Input image tensor or array.
         :return: Extracted text or an empty string on error.
         """
-        if not isinstance(image, tf.Tensor):
-            raise ValueError("Input image must be a tensor.")
+        image = _to_image_tensor(image)
 
-        model = self.load_image_to_text_model()
+        self.load_image_to_text_model()
         try:
-            predictions = model(image)
-            try:
-                # Convert predictions to numpy array once for performance optimization
-                predictions_np = predictions.numpy()
-            except Exception as e:
-                print(f"Error converting predictions to numpy array: {e}")
-                return ""
             # Assuming the model output is a classification, return the top prediction
-            top_prediction = np.argmax(predictions_np, axis=-1)
-            return str(top_prediction)
+            top_prediction = self._compiled['i2t'](image)
+            return str(top_prediction.numpy())
         except Exception as e:
             print(f"Error during image-to-text conversion: {e}")
             return ""
 
-    def image_to_image(self, image: tf.Tensor) -> np.ndarray:
+    def image_to_image(self, image: tf.Tensor) -> tf.Tensor:
         """
         Convert image to image using a pre-trained model.
 
-        :param image: Input image tensor.
-        :return: Transformed image as a numpy array or a placeholder array on error.
+        :param image: Input image tensor or array.
+        :return: Transformed image tensor or a zero tensor shaped like the input on error.
         """
-        if not isinstance(image, tf.Tensor):
-            raise ValueError("Input image must be a tensor.")
+        image = _to_image_tensor(image)
 
-        model = self.load_image_to_image_model()
+        self.load_image_to_image_model()
         try:
-            stylized_image = model([image, image])
-            try:
-                # Convert stylized image to numpy array once for performance optimization
-                stylized_image_np = stylized_image.numpy()
-            except Exception as e:
-                print(f"Error converting stylized image to numpy array: {e}")
-                return np.zeros(image.shape)  # Return a placeholder array on error
-            return stylized_image_np
+            return self._compiled['i2i'](image)
         except Exception as e:
             print(f"Error during image-to-image conversion: {e}")
-            return np.zeros(image.shape)  # Return a placeholder array on error
+            return tf.zeros_like(image)  # Return a placeholder tensor on error
 
     def image_to_video(self, image: tf.Tensor) -> tf.Tensor:
         """
         Convert image to video using a pre-trained model.
 
-        :param image: Input image tensor.
+        :param image: Input image tensor or array.
         :return: Generated video tensor.
         """
-        if not isinstance(image, tf.Tensor):
-            raise ValueError("Input image must be a tensor.")
+        image = _to_image_tensor(image)
 
         model = self.load_image_to_video_model()
         try:
-            # Generate 30 frames for the video
-            frames = [model([image]) for _ in range(30)]
-            video = tf.stack(frames, axis=1)
+            # Generate 30 frames per image in a single batched model call: repeat each image
+            # along a new frame axis, fold frames into the batch, then unfold the output
+            batch_size = tf.shape(image)[0]
+            frame_inputs = tf.repeat(image[:, tf.newaxis], 30, axis=1)
+            frame_inputs = tf.reshape(frame_inputs, tf.concat([[-1], tf.shape(image)[1:]], axis=0))
+            frames = model([frame_inputs])
+            video = tf.reshape(frames, tf.concat([[batch_size, 30], tf.shape(frames)[1:]], axis=0))
             return video
         except Exception as e:
             print(f"Error during image-to-video conversion: {e}")
-            return tf.zeros([1, 30, 256, 256, 3])  # Return a placeholder tensor on error
+            return _placeholder((1, 30, 256, 256, 3))  # Return a cached placeholder tensor on error
 
     def image_to_audio(self, image: tf.Tensor) -> tf.Tensor:
         """
         Convert image to audio by first generating a text description of the image
         and then converting the text description to audio using a pre-trained model.
 
-        :param image: Input image tensor.
+        :param image: Input image tensor or array.
         :return: Generated audio tensor.
         """
-        if not isinstance(image, tf.Tensor):
-            raise ValueError("Input image must be a tensor.")
+        image = _to_image_tensor(image)
 
         # Load the image captioning model
-        captioning_model = self.load_image_captioning_model()
+        self.load_image_captioning_model()
         try:
-            # Generate a caption for the input image
-            predictions = captioning_model(image)
-            predictions_np = predictions.numpy()
-            # Map the predicted class indices to their corresponding labels
-            top_prediction = np.argmax(predictions_np, axis=-1)
-            caption = str(top_prediction)
+            # Generate a caption for the input image from its top predicted class label
+            top_prediction = self._compiled['img_caption'](image)
+            caption = self.load_imagenet_labels()[int(top_prediction[0])]
         except Exception as e:
             print(f"Error during image captioning: {e}")
-            return tf.zeros([1, 16000])  # Return a placeholder tensor on error
+            return _placeholder((1, 16000))  # Return a cached placeholder tensor on error
 
-        # Use the text-to-audio model (Tacotron2) to convert the caption to audio
-        model = self.load_text_to_audio_model()
+        # Use the text-to-audio pipeline to convert the caption to audio
         try:
-            # Preprocess the caption text
-            caption = GermanTransliterate(replace={';': ',', ':': ' '}, sep_abbreviation=' -- ').transliterate(caption)
-            processor = Processor()
-            input_ids = processor.text_to_sequence(caption)
-            input_tensor = tf.constant([input_ids], dtype=tf.int32)
-
-            # Generate mel spectrograms
-            _, mel_outputs, _, _ = model.inference(
-                input_tensor,
-                tf.convert_to_tensor([len(input_ids)], dtype=tf.int32),
-                tf.convert_to_tensor([0], dtype=tf.int32)
-            )
-            # Synthesize audio
-            mb_melgan = self.load_mb_melgan_model()
-            pqmf = self.load_pqmf_model()
-            generated_subbands = mb_melgan(mel_outputs)
-            audio = pqmf.synthesis(generated_subbands)[0, :-1024, 0]
-            # Ensure the audio tensor has the correct shape
-            audio = tf.pad(audio, [[0, max(0, 16000 - tf.shape(audio)[0])]])  # Pad if necessary
-            audio = audio[:16000]  # Trim if necessary
-            return tf.expand_dims(audio, axis=0)  # Ensure shape is (1, 16000)
+            return self.text_to_audio(caption)
         except Exception as e:
             print(f"Error during text-to-audio conversion: {e}")
-            return tf.zeros([1, 16000])  # Return a placeholder tensor on error
+            return _placeholder((1, 16000))  # Return a cached placeholder tensor on error
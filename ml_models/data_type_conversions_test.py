@@ -13,9 +13,9 @@ class TestDataTypeConversions(unittest.TestCase):
         """
         input_text = "Hello, world!"
         try:
-            output_text = self.converter.text_to_text(input_text)
-            self.assertIsInstance(output_text, str, "Output should be a string")
-            self.assertEqual(output_text, str(output_text), "Output should be a string representation of the embeddings")
+            output = self.converter.text_to_text(input_text)
+            self.assertIsInstance(output, dict, "Output should be a dict")
+            self.assertIsInstance(output["embeddings"], tf.Tensor, "Embeddings should be a TensorFlow tensor")
         except Exception as e:
             self.fail(f"test_text_to_text failed: {e}")
 
@@ -74,7 +74,7 @@ class TestDataTypeConversions(unittest.TestCase):
         input_image = tf.random.normal([1, 224, 224, 3])
         try:
             output_image = self.converter.image_to_image(input_image)
-            self.assertIsInstance(output_image, np.ndarray, "Output should be a numpy array")
+            self.assertIsInstance(output_image, tf.Tensor, "Output should be a TensorFlow tensor")
             self.assertEqual(output_image.shape, (1, 224, 224, 3), "Output shape should be (1, 224, 224, 3)")
         except Exception as e:
             self.fail(f"test_image_to_image failed: {e}")
@@ -16,7 +16,7 @@ class TestDataTypeConversions(unittest.TestCase):
     def test_text_to_text(self):
         input_text = "Hello, world!"
         result = self.converter.text_to_text(input_text)
-        self.assertIsInstance(result, str)
+        self.assertIsInstance(result, dict)
 
     def test_text_to_image(self):
         input_text = "A cat sitting on a mat."
@@ -38,11 +38,15 @@ class TestDataTypeConversions(unittest.TestCase):
         input_image = np.random.rand(224, 224, 3).astype(np.float32)
         result = self.converter.image_to_text(input_image)
         self.assertIsInstance(result, str)
+        self.assertNotEqual(result, "")  # An empty string means the conversion failed
 
     def test_image_to_image(self):
         input_image = np.random.rand(224, 224, 3).astype(np.float32)
         result = self.converter.image_to_image(input_image)
-        self.assertIsInstance(result, np.ndarray)
+        self.assertIsInstance(result, tf.Tensor)
+        self.assertEqual(result.shape[0], 1)
+        # A zero tensor is the error placeholder, so a real stylized image must be non-zero
+        self.assertGreater(float(tf.reduce_max(tf.abs(result))), 0.0)
 
     def test_image_to_video(self):
         input_image = np.random.rand(224, 224, 3).astype(np.float32)
@@ -2,7 +2,6 @@ import os
 import re
 import time
 import tensorflow as tf
-from scipy.io import wavfile
 from german_transliterate.core import GermanTransliterate
 
 # Define special symbols and all symbols used by the model
@@ -95,4 +94,5 @@ class TTSModule:
         audio = self.mbmelgan.inference(mel_outputs)[0, :-1024, 0]
         duration = time.time() - start
         print(f"it took {duration} secs")
-        wavfile.write(output_path, 22050, audio.numpy())
+        # encode_wav writes 16-bit PCM, clipping samples to [-1, 1]
+        tf.io.write_file(output_path, tf.audio.encode_wav(tf.expand_dims(audio, axis=-1), 22050))
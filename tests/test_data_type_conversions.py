@@ -1,7 +1,12 @@
+import os
+import tempfile
+import threading
+import time
 import unittest
 import tensorflow as tf
 import numpy as np
-from ml_models.data_type_conversions import DataTypeConversions
+from ml_models import data_type_conversions
+from ml_models.data_type_conversions import ALL_SYMBOLS, DataTypeConversions, Processor, embedding_statistics, text_to_sequence
 
 class TestDataTypeConversions(unittest.TestCase):
     def setUp(self):
@@ -10,8 +15,10 @@ class TestDataTypeConversions(unittest.TestCase):
     def test_text_to_text(self):
         text = "Hello, world!"
         result = self.converter.text_to_text(text)
-        self.assertIsInstance(result, str)
-        self.assertNotEqual(result, "")
+        self.assertIsInstance(result, dict)
+        self.assertIsInstance(result["embeddings"], tf.Tensor)
+        for key in ("mean", "variance", "stddev", "skewness", "kurtosis"):
+            self.assertIn(key, result)
 
     def test_text_to_image(self):
         text = "dog"
@@ -39,7 +46,7 @@ class TestDataTypeConversions(unittest.TestCase):
     def test_image_to_image(self):
         image = tf.random.uniform((1, 256, 256, 3), minval=0, maxval=1, dtype=tf.float32)
         result = self.converter.image_to_image(image)
-        self.assertIsInstance(result, np.ndarray)
+        self.assertIsInstance(result, tf.Tensor)
         self.assertEqual(result.shape, (1, 256, 256, 3))
 
     def test_image_to_video(self):
@@ -54,5 +61,136 @@ class TestDataTypeConversions(unittest.TestCase):
         self.assertIsInstance(result, tf.Tensor)
         self.assertEqual(result.shape, (1, 16000))
 
+class TestImageInputs(unittest.TestCase):
+    def test_unbatched_array_gets_batch_axis(self):
+        image = data_type_conversions._to_image_tensor(np.random.rand(224, 224, 3).astype(np.float32))
+        self.assertEqual(image.shape, (1, 224, 224, 3))
+        self.assertEqual(image.dtype, tf.float32)
+
+    def test_batched_float32_tensor_is_unchanged(self):
+        image = tf.random.uniform((2, 32, 32, 3))
+        self.assertIs(data_type_conversions._to_image_tensor(image), image)
+
+    def test_integer_image_is_scaled(self):
+        image = data_type_conversions._to_image_tensor(np.full((8, 8, 3), 255, dtype=np.uint8))
+        np.testing.assert_allclose(image.numpy(), np.ones((1, 8, 8, 3)))
+
+class TestSharedModelCache(unittest.TestCase):
+    def setUp(self):
+        self.key = ("test", self.id())
+        self.addCleanup(data_type_conversions._MODEL_CACHE.pop, self.key, None)
+
+    def test_loader_runs_once_under_concurrent_calls(self):
+        calls = []
+        barrier = threading.Barrier(8)
+
+        def loader():
+            calls.append(None)
+            time.sleep(0.05)
+            return object()
+
+        results = []
+
+        def load():
+            barrier.wait()
+            results.append(data_type_conversions._load_shared(self.key, loader))
+
+        threads = [threading.Thread(target=load) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(results), 8)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_failed_load_is_retried(self):
+        def failing_loader():
+            raise RuntimeError("download failed")
+
+        with self.assertRaises(RuntimeError):
+            data_type_conversions._load_shared(self.key, failing_loader)
+        self.assertEqual(data_type_conversions._load_shared(self.key, lambda: "loaded"), "loaded")
+
+    def test_instances_share_loaded_objects(self):
+        first, second = DataTypeConversions(), DataTypeConversions()
+        self.assertIs(first.load_mb_config(), second.load_mb_config())
+
+class TestAudioFiles(unittest.TestCase):
+    def test_write_read_round_trip(self):
+        converter = DataTypeConversions()
+        audio = tf.constant([[0.0, 0.5, -0.5, 0.25, -1.0, 1.0], [0.1, -0.1, 0.2, -0.2, 0.3, -0.3]])
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "round_trip.wav")
+            converter.write_audio(audio, path, sample_rate=16000)
+            result, sample_rate = converter.read_audio(path)
+        self.assertEqual(sample_rate, 16000)
+        self.assertEqual(result.shape, (2, 6))
+        # 16-bit PCM quantization error is at most one step
+        np.testing.assert_allclose(result.numpy(), audio.numpy(), atol=1.0 / 32767)
+
+    def test_write_clips_out_of_range_samples(self):
+        converter = DataTypeConversions()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "clipped.wav")
+            converter.write_audio(tf.constant([[2.0, -2.0]]), path)
+            result, _ = converter.read_audio(path)
+        np.testing.assert_allclose(result.numpy(), [[1.0, -1.0]], atol=1.0 / 32767)
+
+class TestTextToSequence(unittest.TestCase):
+    def baseline_sequence(self, text):
+        # Reference per-character dict lookup the lookup table replaces
+        symbol_to_id = {s: i for i, s in enumerate(ALL_SYMBOLS)}
+        return [symbol_to_id.get(s, symbol_to_id["pad"]) for s in text]
+
+    def assert_matches_baseline(self, text):
+        expected = self.baseline_sequence(text)
+        result = text_to_sequence(text)
+        self.assertEqual(result.dtype, np.int32)
+        self.assertEqual(result.tolist(), expected)
+        self.assertEqual(Processor().text_to_sequence(text), expected)
+
+    def test_ascii(self):
+        self.assert_matches_baseline("Hello, world! It's (a) test-case?")
+        self.assert_matches_baseline("digits 123 and ~_@ are unknown")
+
+    def test_empty(self):
+        self.assert_matches_baseline("")
+
+    def test_latin1_outside_symbol_set(self):
+        self.assert_matches_baseline("Möchtest du das meiner Frau erklären? Straße \xff\xa0")
+
+    def test_above_latin1(self):
+        self.assert_matches_baseline("\u0100 \u20ac \u65e5\u672c \U0001F600")
+
+    def test_lone_surrogate(self):
+        self.assert_matches_baseline("a\udc80b")
+
+class TestEmbeddingStatistics(unittest.TestCase):
+    def test_known_moments(self):
+        values = np.array([[0.0, 0.0, 0.0, 1.0], [2.0, 3.0, 5.0, 9.0]], dtype=np.float32)
+        mean, variance, stddev, skewness, kurtosis = embedding_statistics(tf.constant(values))
+        flat = values.ravel().astype(np.float64)
+        centered = flat - flat.mean()
+        expected_variance = np.mean(centered ** 2)
+        self.assertAlmostEqual(float(mean), flat.mean(), places=5)
+        self.assertAlmostEqual(float(variance), expected_variance, places=4)
+        self.assertAlmostEqual(float(stddev), np.sqrt(expected_variance), places=4)
+        self.assertAlmostEqual(float(skewness), np.mean(centered ** 3) / expected_variance ** 1.5, places=4)
+        self.assertAlmostEqual(float(kurtosis), np.mean(centered ** 4) / expected_variance ** 2 - 3.0, places=4)
+
+    def test_symmetric_input(self):
+        _, variance, _, skewness, kurtosis = embedding_statistics(tf.constant([[1.0, 2.0, 3.0, 4.0]]))
+        self.assertAlmostEqual(float(variance), 1.25, places=5)
+        self.assertAlmostEqual(float(skewness), 0.0, places=5)
+        self.assertAlmostEqual(float(kurtosis), -1.36, places=5)
+
+    def test_constant_input_is_finite(self):
+        mean, variance, stddev, skewness, kurtosis = embedding_statistics(tf.zeros([1, 768]))
+        for value in (mean, variance, stddev, skewness, kurtosis):
+            self.assertFalse(np.isnan(float(value)))
+        self.assertEqual(float(skewness), 0.0)
+        self.assertEqual(float(kurtosis), 0.0)
+
 if __name__ == "__main__":
     unittest.main()
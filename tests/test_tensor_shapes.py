@@ -35,7 +35,7 @@ try:
     print(f"Mel outputs shape: {mel_outputs.shape}")
 
     # Synthesize audio subbands and print shape
-    generated_subbands = mb_melgan(mel_outputs)
+    generated_subbands = tf.cast(mb_melgan(mel_outputs), tf.float32)
     print(f"Generated subbands shape: {generated_subbands.shape}")
 
     # PQMF synthesis and print shape